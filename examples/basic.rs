@@ -52,10 +52,10 @@ impl GraphicsCaptureApiHandler for Capture {
         frame: &mut Frame,
         capture_control: InternalCaptureControl,
     ) -> Result<(), Self::Error> {
-        print!(
-            "\rRecording for: {} seconds",
-            self.start.elapsed().as_secs()
-        );
+        // Read the clock once and reuse it for the progress line and the stop check
+        let elapsed = self.start.elapsed().as_secs();
+
+        print!("\rRecording for: {elapsed} seconds");
         io::stdout().flush()?;
 
         // Send the frame to the video encoder
@@ -67,7 +67,7 @@ impl GraphicsCaptureApiHandler for Capture {
         // let data = frame.buffer()?;
 
         // Stop the capture after 6 seconds
-        if self.start.elapsed().as_secs() >= 6 {
+        if elapsed >= 6 {
             // Finish the encoder and save the video.
             self.encoder.take().unwrap().finish()?;
 
@@ -100,7 +100,7 @@ fn main() {
         // Draw Borders Settings
         DrawBorderSettings::Default,
         // The desired color format for the captured frame.
-        ColorFormat::Rgba8,
+        ColorFormat::Bgra8,
         // Additional flags for the capture settings that will be passed to user defined `new` function.
         "Yea This Works".to_string(),
     );
@@ -11,8 +11,8 @@ use std::{
 
 use parking_lot::{Condvar, Mutex};
 use windows::{
-    core::HSTRING,
-    Foundation::{EventRegistrationToken, TimeSpan, TypedEventHandler},
+    core::{GUID, HSTRING},
+    Foundation::{EventRegistrationToken, PropertyValue, TimeSpan, TypedEventHandler},
     Graphics::{
         DirectX::Direct3D11::IDirect3DSurface,
         Imaging::{BitmapAlphaMode, BitmapEncoder, BitmapPixelFormat},
@@ -26,7 +26,7 @@ use windows::{
             MediaEncodingProfile, MediaEncodingSubtypes, VideoEncodingProperties,
             VideoEncodingQuality,
         },
-        Transcoding::MediaTranscoder,
+        Transcoding::{MediaTranscoder, PrepareTranscodeResult, TranscodeFailureReason},
     },
     Security::Cryptography::CryptographicBuffer,
     Storage::{
@@ -43,6 +43,10 @@ use crate::{
     settings::ColorFormat,
 };
 
+/// `MF_MT_MAX_KEYFRAME_SPACING` media type attribute, the maximum number of frames between
+/// two key frames.
+const MF_MT_MAX_KEYFRAME_SPACING: GUID = GUID::from_u128(0xc16eb52b_73a1_476f_8d62_839d6a020652);
+
 #[derive(thiserror::Error, Eq, PartialEq, Clone, Debug)]
 pub enum ImageEncoderError {
     #[error("This color format is not supported for saving as image")]
@@ -148,6 +152,8 @@ pub enum VideoEncoderError {
     FrameSendError(#[from] mpsc::SendError<Option<(VideoEncoderSource, TimeSpan)>>),
     #[error("IO Error: {0}")]
     IoError(#[from] std::io::Error),
+    #[error("Neither the hardware nor the software encoder can transcode: {0:?}")]
+    TranscodeUnsupported(TranscodeFailureReason),
 }
 
 unsafe impl Send for VideoEncoderError {}
@@ -186,6 +192,9 @@ pub enum VideoEncoderSource {
 /// The `VideoEncoder` struct represents a video encoder that can be used to encode video frames and save them to a specified file path.
 pub struct VideoEncoder {
     first_timespan: Option<TimeSpan>,
+    frame_interval: Option<i64>,
+    next_timespan: Option<i64>,
+    dropped_frames: u64,
     frame_sender: mpsc::Sender<Option<(VideoEncoderSource, TimeSpan)>>,
     sample_requested: EventRegistrationToken,
     media_stream_source: MediaStreamSource,
@@ -205,6 +214,7 @@ impl VideoEncoder {
     /// * `width` - The width of the video frames.
     /// * `height` - The height of the video frames.
     /// * `path` - The file path where the encoded video will be saved.
+    /// * `fps` - The frame rate of the video, frames sent faster than this are dropped.
     ///
     /// # Returns
     ///
@@ -246,15 +256,24 @@ impl VideoEncoder {
         media_encoding_profile
             .Video()?
             .SetHeight(height)?;
-        if fps.is_some() {
+        if let Some(fps) = fps {
             media_encoding_profile
                 .Video()?
                 .FrameRate()?
-                .SetNumerator(fps.unwrap())?;
+                .SetNumerator(fps)?;
             media_encoding_profile
                 .Video()?
                 .FrameRate()?
                 .SetDenominator(1)?;
+
+            // Key frame every second instead of leaving the GOP length to the encoder, a
+            // zero fps has no interval just like the frame pacing in `is_too_soon`
+            if fps > 0 {
+                media_encoding_profile.Video()?.Properties()?.Insert(
+                    &MF_MT_MAX_KEYFRAME_SPACING,
+                    &PropertyValue::CreateUInt32(fps)?,
+                )?;
+            }
         }
     
         let video_encoding_properties = VideoEncodingProperties::CreateUncompressed(
@@ -349,13 +368,12 @@ impl VideoEncoder {
         let file = StorageFile::GetFileFromPathAsync(path)?.get()?;
         let media_stream_output = file.OpenAsync(FileAccessMode::ReadWrite)?.get()?;
 
-        let transcode = media_transcoder
-            .PrepareMediaStreamSourceTranscodeAsync(
-                &media_stream_source,
-                &media_stream_output,
-                &media_encoding_profile,
-            )?
-            .get()?;
+        let transcode = Self::prepare_transcode(
+            &media_transcoder,
+            &media_stream_source,
+            &media_stream_output,
+            &media_encoding_profile,
+        )?;
 
         let error_notify = Arc::new(AtomicBool::new(false));
         let transcode_thread = thread::spawn({
@@ -378,6 +396,11 @@ impl VideoEncoder {
 
         Ok(Self {
             first_timespan: None,
+            frame_interval: fps
+                .filter(|fps| *fps > 0)
+                .map(|fps| 10_000_000 / i64::from(fps)),
+            next_timespan: None,
+            dropped_frames: 0,
             frame_sender,
             sample_requested,
             media_stream_source,
@@ -513,13 +536,12 @@ impl VideoEncoder {
         let media_transcoder = MediaTranscoder::new()?;
         media_transcoder.SetHardwareAccelerationEnabled(true)?;
 
-        let transcode = media_transcoder
-            .PrepareMediaStreamSourceTranscodeAsync(
-                &media_stream_source,
-                &stream,
-                &media_encoding_profile,
-            )?
-            .get()?;
+        let transcode = Self::prepare_transcode(
+            &media_transcoder,
+            &media_stream_source,
+            &stream,
+            &media_encoding_profile,
+        )?;
 
         let error_notify = Arc::new(AtomicBool::new(false));
         let transcode_thread = thread::spawn({
@@ -542,6 +564,9 @@ impl VideoEncoder {
 
         Ok(Self {
             first_timespan: None,
+            frame_interval: None,
+            next_timespan: None,
+            dropped_frames: 0,
             frame_sender,
             sample_requested,
             media_stream_source,
@@ -552,6 +577,91 @@ impl VideoEncoder {
         })
     }
 
+    /// Prepares the transcode, preferring the hardware encoder and falling back to the
+    /// software encoder when the hardware one can't handle the encoding profile.
+    ///
+    /// # Arguments
+    ///
+    /// * `media_transcoder` - The transcoder with hardware acceleration enabled.
+    /// * `media_stream_source` - The source that provides the frames.
+    /// * `stream` - The stream where the encoded video will be saved.
+    /// * `media_encoding_profile` - The encoding profile of the output video.
+    ///
+    /// # Returns
+    ///
+    /// Returns a `Result` containing the `PrepareTranscodeResult` if either encoder can transcode,
+    /// or a `VideoEncoderError` if an error occurs.
+    fn prepare_transcode(
+        media_transcoder: &MediaTranscoder,
+        media_stream_source: &MediaStreamSource,
+        stream: &IRandomAccessStream,
+        media_encoding_profile: &MediaEncodingProfile,
+    ) -> Result<PrepareTranscodeResult, VideoEncoderError> {
+        let transcode = media_transcoder
+            .PrepareMediaStreamSourceTranscodeAsync(
+                media_stream_source,
+                stream,
+                media_encoding_profile,
+            )?
+            .get()?;
+
+        if transcode.CanTranscode()? {
+            return Ok(transcode);
+        }
+
+        // The hardware encoder doesn't support this profile, retry with the software encoder
+        media_transcoder.SetHardwareAccelerationEnabled(false)?;
+
+        let transcode = media_transcoder
+            .PrepareMediaStreamSourceTranscodeAsync(
+                media_stream_source,
+                stream,
+                media_encoding_profile,
+            )?
+            .get()?;
+
+        if !transcode.CanTranscode()? {
+            return Err(VideoEncoderError::TranscodeUnsupported(
+                transcode.FailureReason()?,
+            ));
+        }
+
+        Ok(transcode)
+    }
+
+    /// Checks if a frame arrived sooner than the frame rate of the video allows, so it can
+    /// be dropped instead of blocking the caller until the encoder requests it.
+    ///
+    /// # Arguments
+    ///
+    /// * `timespan` - The timespan of the frame.
+    ///
+    /// # Returns
+    ///
+    /// Returns `true` if the frame should be dropped.
+    fn is_too_soon(&mut self, timespan: i64) -> bool {
+        let Some(frame_interval) = self.frame_interval else {
+            return false;
+        };
+
+        // A quarter interval of tolerance so capture jitter doesn't skip frames that are on time
+        if let Some(next_timespan) = self.next_timespan {
+            if timespan + frame_interval / 4 < next_timespan {
+                self.dropped_frames += 1;
+                return true;
+            }
+        }
+
+        self.next_timespan = match self.next_timespan {
+            Some(next_timespan) if next_timespan + frame_interval > timespan => {
+                Some(next_timespan + frame_interval)
+            }
+            _ => Some(timespan + frame_interval),
+        };
+
+        false
+    }
+
     /// Sends a video frame to the video encoder for encoding.
     ///
     /// # Arguments
@@ -563,24 +673,49 @@ impl VideoEncoder {
     /// Returns `Ok(())` if the frame is successfully sent for encoding, or a `VideoEncoderError`
     /// if an error occurs.
     pub fn send_frame(&mut self, frame: &mut Frame) -> Result<(), VideoEncoderError> {
+        self.send_frame_surface(unsafe { frame.as_raw_surface() }, frame.timespan().Duration)
+    }
+
+    /// Sends a Direct3D surface to the video encoder for encoding.
+    ///
+    /// # Arguments
+    ///
+    /// * `surface` - The surface to be encoded, it stays on the GPU.
+    /// * `timespan` - The timespan that correlates to the surface.
+    ///
+    /// # Returns
+    ///
+    /// Returns `Ok(())` if the surface is successfully sent for encoding, or a
+    /// `VideoEncoderError` if an error occurs.
+    pub fn send_frame_surface(
+        &mut self,
+        surface: IDirect3DSurface,
+        timespan: i64,
+    ) -> Result<(), VideoEncoderError> {
+        if self.is_too_soon(timespan) {
+            return Ok(());
+        }
+
+        let frame_timespan = timespan;
         let timespan = match self.first_timespan {
             Some(timespan) => TimeSpan {
-                Duration: frame.timespan().Duration - timespan.Duration,
+                Duration: frame_timespan - timespan.Duration,
             },
             None => {
-                let timespan = frame.timespan();
-                self.first_timespan = Some(timespan);
+                self.first_timespan = Some(TimeSpan {
+                    Duration: frame_timespan,
+                });
                 TimeSpan { Duration: 0 }
             }
         };
-        let surface = SendDirectX::new(unsafe { frame.as_raw_surface() });
+        let surface = SendDirectX::new(surface);
 
         self.frame_sender
             .send(Some((VideoEncoderSource::DirectX(surface), timespan)))?;
 
         let (lock, cvar) = &*self.frame_notify;
         let mut processed = lock.lock();
-        if !*processed {
+        while !*processed {
             cvar.wait(&mut processed);
         }
         *processed = false;
@@ -613,6 +748,10 @@ impl VideoEncoder {
         buffer: &[u8],
         timespan: i64,
     ) -> Result<(), VideoEncoderError> {
+        if self.is_too_soon(timespan) {
+            return Ok(());
+        }
+
         let frame_timespan = timespan;
         let timespan = match self.first_timespan {
             Some(timespan) => TimeSpan {
@@ -632,7 +771,7 @@ impl VideoEncoder {
 
         let (lock, cvar) = &*self.frame_notify;
         let mut processed = lock.lock();
-        if !*processed {
+        while !*processed {
             cvar.wait(&mut processed);
         }
         *processed = false;
@@ -649,6 +788,17 @@ impl VideoEncoder {
         Ok(())
     }
 
+    /// Gets the number of frames dropped because they arrived sooner than the frame rate of
+    /// the video allows.
+    ///
+    /// # Returns
+    ///
+    /// The number of dropped frames.
+    #[must_use]
+    pub const fn dropped_frames(&self) -> u64 {
+        self.dropped_frames
+    }
+
     /// Finishes encoding the video and performs any necessary cleanup.
     ///
     /// # Returns
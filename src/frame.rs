@@ -2,10 +2,13 @@ use std::{
     fs::{self},
     io,
     path::Path,
-    ptr, slice,
+    slice,
 };
 
-use rayon::iter::{IntoParallelIterator, ParallelIterator};
+use rayon::{
+    iter::{IndexedParallelIterator, ParallelIterator},
+    slice::{ParallelSlice, ParallelSliceMut},
+};
 use windows::{
     Foundation::TimeSpan,
     Graphics::DirectX::Direct3D11::IDirect3DSurface,
@@ -63,6 +66,9 @@ pub struct Frame<'a> {
     time: TimeSpan,
     context: &'a ID3D11DeviceContext,
     buffer: &'a mut Vec<u8>,
+    staging_texture: Option<ID3D11Texture2D>,
+    staging_texture_cache: Option<&'a mut Option<ID3D11Texture2D>>,
+    staging_texture_mapped: bool,
     width: u32,
     height: u32,
     color_format: ColorFormat,
@@ -106,12 +112,58 @@ impl<'a> Frame<'a> {
             time,
             context,
             buffer,
+            staging_texture: None,
+            staging_texture_cache: None,
+            staging_texture_mapped: false,
             width,
             height,
             color_format,
         }
     }
 
+    /// Create a new Frame that reuses the CPU readable texture of the previous frame.
+    ///
+    /// The texture is taken out of `staging_texture` and put back when the frame is dropped,
+    /// so `buffer` doesn't have to create a new one for every frame.
+    ///
+    /// # Arguments
+    ///
+    /// Same as `new`, with `staging_texture` holding the texture shared across frames.
+    ///
+    /// # Returns
+    ///
+    /// A new Frame instance.
+    #[allow(clippy::too_many_arguments)]
+    #[must_use]
+    pub(crate) fn with_staging_texture(
+        d3d_device: &'a ID3D11Device,
+        frame_surface: IDirect3DSurface,
+        frame_texture: ID3D11Texture2D,
+        time: TimeSpan,
+        context: &'a ID3D11DeviceContext,
+        buffer: &'a mut Vec<u8>,
+        staging_texture: &'a mut Option<ID3D11Texture2D>,
+        width: u32,
+        height: u32,
+        color_format: ColorFormat,
+    ) -> Self {
+        let mut frame = Self::new(
+            d3d_device,
+            frame_surface,
+            frame_texture,
+            time,
+            context,
+            buffer,
+            width,
+            height,
+            color_format,
+        );
+        frame.staging_texture = staging_texture.take();
+        frame.staging_texture_cache = Some(staging_texture);
+
+        frame
+    }
+
     /// Get the width of the frame.
     ///
     /// # Returns
@@ -162,6 +214,14 @@ impl<'a> Frame<'a> {
     ///
     /// The FrameBuffer containing the frame data.
     pub fn buffer(&mut self) -> Result<FrameBuffer, Error> {
+        // Unmap the texture if a previous call mapped it
+        if self.staging_texture_mapped {
+            if let Some(texture) = self.staging_texture.as_ref() {
+                unsafe { self.context.Unmap(texture, 0) };
+            }
+            self.staging_texture_mapped = false;
+        }
+
         // Texture Settings
         let texture_desc = D3D11_TEXTURE2D_DESC {
             Width: self.width,
@@ -179,13 +239,29 @@ impl<'a> Frame<'a> {
             MiscFlags: 0,
         };
 
+        // Reuse the texture that CPU can read unless the frame size or format changed
+        if let Some(texture) = self.staging_texture.as_ref() {
+            let mut desc = D3D11_TEXTURE2D_DESC::default();
+            unsafe { texture.GetDesc(&mut desc) };
+
+            if desc.Width != texture_desc.Width
+                || desc.Height != texture_desc.Height
+                || desc.Format != texture_desc.Format
+            {
+                self.staging_texture = None;
+            }
+        }
+
         // Create a texture that CPU can read
-        let mut texture = None;
-        unsafe {
-            self.d3d_device
-                .CreateTexture2D(&texture_desc, None, Some(&mut texture))?;
-        };
-        let texture = texture.unwrap();
+        if self.staging_texture.is_none() {
+            let mut texture = None;
+            unsafe {
+                self.d3d_device
+                    .CreateTexture2D(&texture_desc, None, Some(&mut texture))?;
+            };
+            self.staging_texture = texture;
+        }
+        let texture = self.staging_texture.clone().unwrap();
 
         // Copy the real texture to copy texture
         unsafe {
@@ -203,6 +279,7 @@ impl<'a> Frame<'a> {
                 Some(&mut mapped_resource),
             )?;
         };
+        self.staging_texture_mapped = true;
 
         // Get the mapped resource data slice
         let mapped_frame_data = unsafe {
@@ -358,6 +435,21 @@ impl<'a> Frame<'a> {
     }
 }
 
+impl Drop for Frame<'_> {
+    fn drop(&mut self) {
+        // The staging texture is reused by the next frame so it can't stay mapped
+        if self.staging_texture_mapped {
+            if let Some(texture) = self.staging_texture.as_ref() {
+                unsafe { self.context.Unmap(texture, 0) };
+            }
+        }
+
+        if let Some(staging_texture_cache) = self.staging_texture_cache.take() {
+            *staging_texture_cache = self.staging_texture.take();
+        }
+    }
+}
+
 /// Represents a frame buffer containing pixel data.
 ///
 /// # Example
@@ -466,24 +558,16 @@ impl<'a> FrameBuffer<'a> {
         };
 
         let frame_size = (self.width * self.height * multiplyer) as usize;
-        if self.buffer.capacity() < frame_size {
+        if self.buffer.len() < frame_size {
             self.buffer.resize(frame_size, 0);
         }
 
+        // Copy every row without its padding in one parallel pass over both buffers
         let width_size = (self.width * multiplyer) as usize;
-        let buffer_address = self.buffer.as_mut_ptr() as isize;
-        (0..self.height).into_par_iter().for_each(|y| {
-            let index = (y * self.row_pitch) as usize;
-            let ptr = buffer_address as *mut u8;
-
-            unsafe {
-                ptr::copy_nonoverlapping(
-                    self.raw_buffer.as_ptr().add(index),
-                    ptr.add(y as usize * width_size),
-                    width_size,
-                );
-            }
-        });
+        self.buffer[0..frame_size]
+            .par_chunks_exact_mut(width_size)
+            .zip(self.raw_buffer.par_chunks(self.row_pitch as usize))
+            .for_each(|(row, raw_row)| row.copy_from_slice(&raw_row[..width_size]));
 
         Ok(&mut self.buffer[0..frame_size])
     }
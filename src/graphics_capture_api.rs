@@ -28,6 +28,10 @@ use crate::{
     settings::{ColorFormat, CursorCaptureSettings, DrawBorderSettings},
 };
 
+/// Number of frame pool buffers, with two the next frame can be captured while the current
+/// one is still being processed or encoded.
+const FRAME_POOL_BUFFERS: i32 = 2;
+
 #[derive(thiserror::Error, Eq, PartialEq, Clone, Debug)]
 pub enum Error {
     #[error("Graphics capture API is not supported")]
@@ -144,8 +148,12 @@ impl GraphicsCaptureApi {
         let pixel_format = DirectXPixelFormat(color_format as i32);
 
         // Create frame pool
-        let frame_pool =
-            Direct3D11CaptureFramePool::Create(&direct3d_device, pixel_format, 1, item.Size()?)?;
+        let frame_pool = Direct3D11CaptureFramePool::Create(
+            &direct3d_device,
+            pixel_format,
+            FRAME_POOL_BUFFERS,
+            item.Size()?,
+        )?;
         let frame_pool = Arc::new(frame_pool);
 
         // Create capture session
@@ -153,6 +161,7 @@ impl GraphicsCaptureApi {
 
         // Preallocate memory
         let mut buffer = vec![0u8; 3840 * 2160 * 4];
+        let mut staging_texture = SendDirectX::new(None);
 
         // Indicates if the capture is closed
         let halt = Arc::new(AtomicBool::new(false));
@@ -200,6 +209,9 @@ impl GraphicsCaptureApi {
             let callback_frame_pool = callback;
             let direct3d_device_recreate = SendDirectX::new(direct3d_device.clone());
 
+            // Capture stops for good once this is set so one flag serves every frame
+            let stop = Arc::new(AtomicBool::new(false));
+
             move |frame, _| {
                 // Return early if the capture is closed
                 if halt_frame_pool.load(atomic::Ordering::Relaxed) {
@@ -236,7 +248,7 @@ impl GraphicsCaptureApi {
                     frame_pool_recreate.Recreate(
                         &direct3d_device_recreate.0,
                         pixel_format,
-                        1,
+                        FRAME_POOL_BUFFERS,
                         frame_content_size,
                     )?;
 
@@ -249,21 +261,23 @@ impl GraphicsCaptureApi {
                 let texture_width = desc.Width;
                 let texture_height = desc.Height;
 
-                // Create a frame
-                let mut frame = Frame::new(
+                // Create a frame, rebinding `staging_texture` makes the closure capture the
+                // whole `SendDirectX` instead of only its non-Send `.0` field
+                let staging_texture = &mut staging_texture;
+                let mut frame = Frame::with_staging_texture(
                     &d3d_device_frame_pool,
                     frame_surface,
                     frame_texture,
                     timespan,
                     &context,
                     &mut buffer,
+                    &mut staging_texture.0,
                     texture_width,
                     texture_height,
                     color_format,
                 );
 
                 // Init internal capture control
-                let stop = Arc::new(AtomicBool::new(false));
                 let internal_capture_control = InternalCaptureControl::new(stop.clone());
 
                 // Send the frame to the callback struct
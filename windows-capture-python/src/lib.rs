@@ -3,12 +3,14 @@
 #![allow(clippy::redundant_pub_crate)]
 #![allow(clippy::multiple_crate_versions)] // Should update as soon as possible
 
-use std::sync::Arc;
+use std::{slice, sync::Arc};
 
 use ::windows_capture::{
     capture::{
         CaptureControl, CaptureControlError, GraphicsCaptureApiError, GraphicsCaptureApiHandler,
     },
+    d3d11::SendDirectX,
+    encoder::{VideoEncoder, VideoEncoderQuality, VideoEncoderType},
     frame::{self, Frame},
     graphics_capture_api::InternalCaptureControl,
     monitor::Monitor,
@@ -16,12 +18,19 @@ use ::windows_capture::{
     window::Window,
 };
 use pyo3::{exceptions::PyException, prelude::*, types::PyList};
+use rayon::{
+    iter::{IndexedParallelIterator, ParallelIterator},
+    slice::{ParallelSlice, ParallelSliceMut},
+};
+use windows::Graphics::DirectX::Direct3D11::IDirect3DSurface;
 
 /// Fastest Windows Screen Capture Library For Python 🔥.
 #[pymodule]
 fn windows_capture(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<NativeWindowsCapture>()?;
     m.add_class::<NativeCaptureControl>()?;
+    m.add_class::<NativeVideoEncoder>()?;
+    m.add_class::<NativeFrameSurface>()?;
     Ok(())
 }
 
@@ -172,7 +181,7 @@ impl NativeWindowsCapture {
     }
 
     /// Start Capture
-    pub fn start(&mut self) -> PyResult<()> {
+    pub fn start(&mut self, py: Python) -> PyResult<()> {
         if self.window_name.is_some() {
             let window = match Window::from_contains_name(self.window_name.as_ref().unwrap()) {
                 Ok(window) => window,
@@ -194,7 +203,8 @@ impl NativeWindowsCapture {
                 ),
             );
 
-            match InnerNativeWindowsCapture::start(settings) {
+            // Release The GIL While The Message Loop Runs, Callbacks Reacquire It Per Frame
+            match py.allow_threads(|| InnerNativeWindowsCapture::start(settings)) {
                 Ok(()) => (),
                 Err(e) => {
                     if let GraphicsCaptureApiError::FrameHandlerError(
@@ -232,7 +242,8 @@ impl NativeWindowsCapture {
                 ),
             );
 
-            match InnerNativeWindowsCapture::start(settings) {
+            // Release The GIL While The Message Loop Runs, Callbacks Reacquire It Per Frame
+            match py.allow_threads(|| InnerNativeWindowsCapture::start(settings)) {
                 Ok(()) => (),
                 Err(e) => {
                     if let GraphicsCaptureApiError::FrameHandlerError(
@@ -342,9 +353,235 @@ impl NativeWindowsCapture {
     }
 }
 
+/// Internal Struct Used For Video Encoding
+#[pyclass]
+pub struct NativeVideoEncoder {
+    video_encoder: Option<VideoEncoder>,
+    width: usize,
+    height: usize,
+    buffer: Vec<u8>,
+    dropped_frames: u64,
+}
+
+#[pymethods]
+impl NativeVideoEncoder {
+    #[new]
+    #[pyo3(signature = (encoder_type, encoder_quality, width, height, path, fps=None))]
+    pub fn new(
+        py: Python,
+        encoder_type: &str,
+        encoder_quality: &str,
+        width: u32,
+        height: u32,
+        path: &str,
+        fps: Option<u32>,
+    ) -> PyResult<Self> {
+        let encoder_type = match encoder_type {
+            "avi" => VideoEncoderType::Avi,
+            "hevc" => VideoEncoderType::Hevc,
+            "mp4" => VideoEncoderType::Mp4,
+            "wmv" => VideoEncoderType::Wmv,
+            "av1" => VideoEncoderType::Av1,
+            "vp9" => VideoEncoderType::Vp9,
+            _ => {
+                return Err(PyException::new_err(format!(
+                    "Invalid Encoder Type -> {encoder_type}"
+                )));
+            }
+        };
+
+        let encoder_quality = match encoder_quality {
+            "auto" => VideoEncoderQuality::Auto,
+            "hd1080p" => VideoEncoderQuality::HD1080p,
+            "hd720p" => VideoEncoderQuality::HD720p,
+            "wvga" => VideoEncoderQuality::Wvga,
+            "ntsc" => VideoEncoderQuality::Ntsc,
+            "pal" => VideoEncoderQuality::Pal,
+            "vga" => VideoEncoderQuality::Vga,
+            "qvga" => VideoEncoderQuality::Qvga,
+            "uhd2160p" => VideoEncoderQuality::Uhd2160p,
+            "uhd4320p" => VideoEncoderQuality::Uhd4320p,
+            _ => {
+                return Err(PyException::new_err(format!(
+                    "Invalid Encoder Quality -> {encoder_quality}"
+                )));
+            }
+        };
+
+        // Opening The File And Preparing The Transcode Block So Release The GIL Meanwhile
+        let video_encoder = match py.allow_threads(|| {
+            VideoEncoder::new(encoder_type, encoder_quality, width, height, path, fps)
+        }) {
+            Ok(video_encoder) => video_encoder,
+            Err(e) => {
+                return Err(PyException::new_err(format!(
+                    "Failed To Create The Video Encoder -> {e}"
+                )));
+            }
+        };
+
+        Ok(Self {
+            video_encoder: Some(video_encoder),
+            width: width as usize,
+            height: height as usize,
+            buffer: Vec::new(),
+            dropped_frames: 0,
+        })
+    }
+
+    /// Send A Bgra Frame Buffer To The Video Encoder, The Frame Must Be A uint8 Array Of
+    /// Shape (Height, Width, 4) With Contiguous Pixels
+    pub fn send_frame_buffer(
+        &mut self,
+        py: Python,
+        frame_buffer: &Bound<'_, PyAny>,
+        timespan: i64,
+    ) -> PyResult<()> {
+        let Some(video_encoder) = self.video_encoder.as_mut() else {
+            return Err(PyException::new_err("Video Encoder Is Already Finished"));
+        };
+        let buffer = &mut self.buffer;
+
+        // The Buffer Protocol Isn't Part Of The abi3-py39 Stable ABI So The Pointer And
+        // Geometry Are Read From The Array Interface And Checked Here Before Any Access
+        let array_interface = frame_buffer.getattr("__array_interface__")?;
+        let typestr: String = array_interface.get_item("typestr")?.extract()?;
+        let shape: Vec<usize> = array_interface.get_item("shape")?.extract()?;
+        let strides: Option<Vec<isize>> = array_interface.get_item("strides")?.extract()?;
+        let (data, _): (usize, bool) = array_interface.get_item("data")?.extract()?;
+
+        let (height, width) = match (typestr.as_str(), shape.as_slice()) {
+            ("|u1", &[height, width, 4]) if height > 0 && width > 0 => (height, width),
+            _ => {
+                return Err(PyException::new_err(
+                    "Frame Buffer Must Be A Non Empty uint8 Array Of Shape (Height, Width, 4)",
+                ));
+            }
+        };
+
+        // Media Foundation Reads A Full Frame Of The Size The Encoder Was Created With
+        if (width, height) != (self.width, self.height) {
+            return Err(PyException::new_err(format!(
+                "Frame Size {width}x{height} Doesn't Match The Video Encoder Size {}x{}",
+                self.width, self.height
+            )));
+        }
+
+        let row_size = width * 4;
+        let row_pitch = match strides.as_deref() {
+            None => row_size,
+            Some(&[row_pitch, 4, 1]) if row_pitch >= row_size as isize => row_pitch as usize,
+            Some(_) => {
+                return Err(PyException::new_err(
+                    "Frame Buffer Pixels Must Be Contiguous With Non Overlapping Rows",
+                ));
+            }
+        };
+
+        let frame_size = row_size * height;
+        let frame_buffer_len = row_pitch * (height - 1) + row_size;
+        let frame_buffer = unsafe { slice::from_raw_parts(data as *const u8, frame_buffer_len) };
+
+        py.allow_threads(|| {
+            // Windows API Expects The Buffer To Be Bottom-Top And Without Padding
+            buffer.resize(frame_size, 0);
+            buffer
+                .par_chunks_exact_mut(row_size)
+                .zip(frame_buffer.par_chunks(row_pitch).rev())
+                .for_each(|(dst, src)| dst.copy_from_slice(&src[..row_size]));
+
+            video_encoder
+                .send_frame_buffer(buffer, timespan)
+                .map_err(|e| {
+                    PyException::new_err(format!(
+                        "Failed To Send The Frame To The Video Encoder -> {e}"
+                    ))
+                })
+        })?;
+
+        Ok(())
+    }
+
+    /// Send A Direct3D Surface To The Video Encoder Without Copying It To The CPU
+    pub fn send_frame_surface(
+        &mut self,
+        py: Python,
+        surface: PyRef<NativeFrameSurface>,
+        timespan: i64,
+    ) -> PyResult<()> {
+        let Some(video_encoder) = self.video_encoder.as_mut() else {
+            return Err(PyException::new_err("Video Encoder Is Already Finished"));
+        };
+
+        let Some(frame_surface) = surface.surface.as_ref() else {
+            return Err(PyException::new_err(
+                "Frame Surface Is Only Valid Inside on_frame_arrived",
+            ));
+        };
+
+        if (surface.width, surface.height) != (self.width, self.height) {
+            return Err(PyException::new_err(format!(
+                "Frame Size {}x{} Doesn't Match The Video Encoder Size {}x{}",
+                surface.width, surface.height, self.width, self.height
+            )));
+        }
+
+        let frame_surface = SendDirectX::new(frame_surface.0.clone());
+
+        py.allow_threads(|| {
+            // Rebinding Makes The Closure Capture The Whole SendDirectX Instead Of Only Its
+            // Non Send Field
+            let frame_surface = frame_surface;
+
+            video_encoder
+                .send_frame_surface(frame_surface.0, timespan)
+                .map_err(|e| {
+                    PyException::new_err(format!(
+                        "Failed To Send The Frame To The Video Encoder -> {e}"
+                    ))
+                })
+        })?;
+
+        Ok(())
+    }
+
+    /// Number Of Frames Dropped Because They Arrived Faster Than The Frame Rate
+    #[must_use]
+    pub fn dropped_frames(&self) -> u64 {
+        self.video_encoder
+            .as_ref()
+            .map_or(self.dropped_frames, VideoEncoder::dropped_frames)
+    }
+
+    /// Finish Encoding And Save The Video
+    pub fn finish(&mut self, py: Python) -> PyResult<()> {
+        py.allow_threads(|| {
+            if let Some(video_encoder) = self.video_encoder.take() {
+                self.dropped_frames = video_encoder.dropped_frames();
+                video_encoder.finish().map_err(|e| {
+                    PyException::new_err(format!("Failed To Finish The Video Encoder -> {e}"))
+                })?;
+            }
+
+            Ok(())
+        })?;
+
+        Ok(())
+    }
+}
+
+/// Direct3D Surface Of A Captured Frame, Released Once on_frame_arrived Returns
+#[pyclass]
+pub struct NativeFrameSurface {
+    surface: Option<SendDirectX<IDirect3DSurface>>,
+    width: usize,
+    height: usize,
+}
+
 struct InnerNativeWindowsCapture {
     on_frame_arrived_callback: Arc<PyObject>,
     on_closed: Arc<PyObject>,
+    stop_list: Py<PyList>,
 }
 
 #[derive(thiserror::Error, Debug)]
@@ -360,9 +597,13 @@ impl GraphicsCaptureApiHandler for InnerNativeWindowsCapture {
     type Error = InnerNativeWindowsCaptureError;
 
     fn new((on_frame_arrived_callback, on_closed): Self::Flags) -> Result<Self, Self::Error> {
+        // Created once and reused for every frame
+        let stop_list = Python::with_gil(|py| PyList::new_bound(py, [false]).unbind());
+
         Ok(Self {
             on_frame_arrived_callback,
             on_closed,
+            stop_list,
         })
     }
 
@@ -373,6 +614,8 @@ impl GraphicsCaptureApiHandler for InnerNativeWindowsCapture {
     ) -> Result<(), Self::Error> {
         let width = frame.width();
         let height = frame.height();
+        let timespan = frame.timespan().Duration;
+        let surface = SendDirectX::new(unsafe { frame.as_raw_surface() });
         let mut buffer = frame
             .buffer()
             .map_err(InnerNativeWindowsCaptureError::FrameProcessError)?;
@@ -382,19 +625,34 @@ impl GraphicsCaptureApiHandler for InnerNativeWindowsCapture {
             py.check_signals()
                 .map_err(InnerNativeWindowsCaptureError::PythonError)?;
 
-            let stop_list = PyList::new_bound(py, [false]);
-            self.on_frame_arrived_callback
-                .call1(
-                    py,
-                    (
-                        buffer.as_ptr() as isize,
-                        buffer.len(),
-                        width,
-                        height,
-                        stop_list.clone(),
-                    ),
-                )
-                .map_err(InnerNativeWindowsCaptureError::PythonError)?;
+            let stop_list = self.stop_list.bind(py);
+            let frame_surface = Py::new(
+                py,
+                NativeFrameSurface {
+                    surface: Some(surface),
+                    width: width as usize,
+                    height: height as usize,
+                },
+            )
+            .map_err(InnerNativeWindowsCaptureError::PythonError)?;
+
+            let result = self.on_frame_arrived_callback.call1(
+                py,
+                (
+                    buffer.as_ptr() as isize,
+                    buffer.len(),
+                    width,
+                    height,
+                    timespan,
+                    frame_surface.clone_ref(py),
+                    stop_list.clone(),
+                ),
+            );
+
+            // The Frame Goes Back To The Frame Pool After This So Python Must Not Keep Using
+            // Its Surface
+            frame_surface.borrow_mut(py).surface = None;
+            result.map_err(InnerNativeWindowsCaptureError::PythonError)?;
 
             if stop_list
                 .get_item(0)
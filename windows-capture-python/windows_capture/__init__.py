@@ -1,6 +1,11 @@
 """Fastest Windows Screen Capture Library For Python 🔥."""
 
-from .windows_capture import NativeWindowsCapture, NativeCaptureControl
+from .windows_capture import (
+    NativeWindowsCapture,
+    NativeCaptureControl,
+    NativeVideoEncoder,
+    NativeFrameSurface,
+)
 import ctypes
 import numpy
 import cv2
@@ -17,11 +22,17 @@ class Frame:
     Attributes
     ----------
     frame_buffer : numpy.ndarray
-        Raw Buffer Of The Frame
+        Raw Buffer Of The Frame, A View Into The Captured Texture That Is Only Valid
+        Inside on_frame_arrived, Use frame_buffer.copy() To Keep It After It Returns
     width : str
         Width Of The Frame
     height : int
         Height Of The Frame
+    timespan : Optional[int]
+        Time Of The Frame In 100-Nanosecond Units, Required By VideoEncoder
+    surface : Optional[NativeFrameSurface]
+        Direct3D Surface Of The Frame, Released Once on_frame_arrived Returns And None
+        For Frames Derived From It
 
     Methods
     -------
@@ -35,11 +46,20 @@ class Frame:
         Converts The self.frame_buffer Pixel Type To Bgr Instead Of Bgra
     """
 
-    def __init__(self, frame_buffer: numpy.ndarray, width: int, height: int) -> None:
+    def __init__(
+        self,
+        frame_buffer: numpy.ndarray,
+        width: int,
+        height: int,
+        timespan: Optional[int] = None,
+        surface: Optional[NativeFrameSurface] = None,
+    ) -> None:
         """Constructs All The Necessary Attributes For The Frame Object"""
         self.frame_buffer = frame_buffer
         self.width = width
         self.height = height
+        self.timespan = timespan
+        self.surface = surface
 
     def save_as_image(self, path: str) -> None:
         """Save The Frame As An Image To The Specified Path"""
@@ -49,7 +69,7 @@ class Frame:
         """Converts The self.frame_buffer Pixel Type To Bgr Instead Of Bgra"""
         bgr_frame_buffer = self.frame_buffer[:, :, :3]
 
-        return Frame(bgr_frame_buffer, self.width, self.height)
+        return Frame(bgr_frame_buffer, self.width, self.height, self.timespan)
 
     def crop(
         self, start_width: int, start_height: int, end_width: int, end_height: int
@@ -60,7 +80,10 @@ class Frame:
         ]
 
         return Frame(
-            cropped_frame_buffer, end_width - start_width, end_height - start_height
+            cropped_frame_buffer,
+            end_width - start_width,
+            end_height - start_height,
+            self.timespan,
         )
 
 
@@ -145,6 +168,8 @@ class WindowsCapture:
         buf_len : int,
         width : int,
         height : int,
+        timespan : int,
+        surface : NativeFrameSurface,
         stop_list : list,
     ):
         This Method Is Called Before The on_frame_arrived Callback Function NEVER
@@ -222,6 +247,8 @@ class WindowsCapture:
         buf_len: int,
         width: int,
         height: int,
+        timespan: int,
+        surface: NativeFrameSurface,
         stop_list: list,
     ) -> None:
         """This Method Is Called Before The on_frame_arrived Callback Function To
@@ -229,28 +256,16 @@ class WindowsCapture:
         if self.frame_handler:
             internal_capture_control = InternalCaptureControl(stop_list)
 
-            row_pitch = int(buf_len / height)
-            if row_pitch == width * 4:
-                ndarray = numpy.ctypeslib.as_array(
-                    ctypes.cast(buf, ctypes.POINTER(ctypes.c_uint8)),
-                    shape=(height, width, 4),
-                )
-
-                frame = Frame(ndarray, width, height)
-                self.frame_handler(frame, internal_capture_control)
-            else:
-                ndarray = numpy.ctypeslib.as_array(
-                    ctypes.cast(buf, ctypes.POINTER(ctypes.c_uint8)),
-                    shape=(height, row_pitch),
-                )[:, : width * 4].reshape(height, width, 4)
-
-                frame = Frame(ndarray, width, height)
-                self.frame_handler(frame, internal_capture_control)
-
-                self.frame_handler(
-                    frame,
-                    internal_capture_control,
-                )
+            # Rows Can Be Padded So View The Buffer With The Row Pitch Instead Of
+            # Copying It Into A Tightly Packed Array, frombuffer Wraps The Memory
+            # Directly Without The Intermediate ctypes Pointer And Array Objects
+            row_pitch = buf_len // height
+            ndarray = numpy.frombuffer(
+                (ctypes.c_uint8 * buf_len).from_address(buf), dtype=numpy.uint8
+            ).reshape(height, row_pitch // 4, 4)[:, :width, :]
+
+            frame = Frame(ndarray, width, height, timespan, surface)
+            self.frame_handler(frame, internal_capture_control)
 
         else:
             raise Exception("on_frame_arrived Event Handler Is Not Set")
@@ -271,3 +286,109 @@ class WindowsCapture:
         else:
             raise Exception("Invalid Event Handler Use on_frame_arrived Or on_closed")
         return handler
+
+
+class VideoEncoder:
+    """
+    Class To Encode Frames Into A Video Using The Hardware Accelerated Windows Media
+    Foundation Encoder, Use It In A with Statement To Finish The Video And Release
+    The File Even When An Exception Is Raised
+
+    ...
+
+    Methods
+    -------
+    send_frame(frame: Frame):
+        Sends The Bgra Frame Buffer Of A Frame To The Video Encoder
+    send_frame_surface(frame: Frame):
+        Sends A Frame To The Video Encoder Straight From Its Direct3D Surface, Skipping
+        The Frame Buffer And Any Changes Made To It
+    dropped_frames() -> int:
+        Number Of Frames Dropped Because They Arrived Faster Than The Frame Rate
+    finish():
+        Finishes Encoding And Saves The Video
+    """
+
+    def __init__(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        encoder_type: str = "mp4",
+        encoder_quality: str = "auto",
+        fps: Optional[int] = None,
+    ) -> None:
+        """
+        Constructs All The Necessary Attributes For The VideoEncoder Object
+
+        ...
+
+        Parameters
+        ----------
+            path : str
+                Path Where The Video Will Be Saved
+            width : int
+                Width Of The Video, Every Frame Sent Must Have The Same Width
+            height : int
+                Height Of The Video, Every Frame Sent Must Have The Same Height
+            encoder_type : str
+                One Of avi, hevc, mp4, wmv, av1 Or vp9
+            encoder_quality : str
+                One Of auto, hd1080p, hd720p, wvga, ntsc, pal, vga, qvga, uhd2160p Or
+                uhd4320p
+            fps : int
+                Frame Rate Of The Video, Frames Sent Faster Than This Are Dropped
+        """
+        self.native_video_encoder = NativeVideoEncoder(
+            encoder_type, encoder_quality, width, height, path, fps
+        )
+
+    def send_frame(self, frame: Frame) -> None:
+        """Sends The Bgra Frame Buffer Of A Frame To The Video Encoder"""
+        if frame.timespan is None:
+            raise Exception("Frame Timespan Is Required To Encode It")
+
+        if frame.frame_buffer.shape != (frame.height, frame.width, 4):
+            raise Exception("Frame Buffer Must Be Bgra With The Frame Width And Height")
+
+        # Padded Or Cropped Frames Are Sent As Is With Their Row Pitch, Only Arrays
+        # With Non Contiguous Pixels Need A Copy
+        frame_buffer = frame.frame_buffer
+        if (
+            frame_buffer.dtype != numpy.uint8
+            or frame_buffer.strides[1:] != (4, 1)
+            or frame_buffer.strides[0] < frame.width * 4
+        ):
+            frame_buffer = numpy.ascontiguousarray(frame_buffer, dtype=numpy.uint8)
+
+        self.native_video_encoder.send_frame_buffer(frame_buffer, frame.timespan)
+
+    def send_frame_surface(self, frame: Frame) -> None:
+        """Sends A Frame To The Video Encoder Straight From Its Direct3D Surface"""
+        # The Surface Is Encoded On The GPU Without Flipping Or Copying The Buffer, So
+        # Changes Made To frame_buffer Are Not Part Of The Video
+        if frame.surface is None:
+            raise Exception(
+                "Frame Has No Surface, Only Frames Inside on_frame_arrived Have One"
+            )
+
+        if frame.timespan is None:
+            raise Exception("Frame Timespan Is Required To Encode It")
+
+        self.native_video_encoder.send_frame_surface(frame.surface, frame.timespan)
+
+    def dropped_frames(self) -> int:
+        """Number Of Frames Dropped Because They Arrived Faster Than The Frame Rate"""
+        return self.native_video_encoder.dropped_frames()
+
+    def finish(self) -> None:
+        """Finishes Encoding And Saves The Video"""
+        self.native_video_encoder.finish()
+
+    def __enter__(self) -> "VideoEncoder":
+        """Returns The VideoEncoder For The with Statement"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Finishes Encoding And Saves The Video When The with Statement Ends"""
+        self.finish()